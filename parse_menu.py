@@ -4,34 +4,43 @@
 import csv
 import json
 import re
+import sys
 from collections import defaultdict
+from functools import cache
 
 # Size indicators that should create separate base items
-SIZE_INDICATORS = {
-    "Small",
-    "Medium",
-    "Large",
-    "Child",
-    "Snack",
-    "Regular Biscuit",
-    "Large Biscuit",
-    "4 piece",
-    "6 piece",
-    "10 piece",
-    "20 piece",
-    "40 piece",
-}
-
-
+SIZE_INDICATORS = frozenset(
+    {
+        "Small",
+        "Medium",
+        "Large",
+        "Child",
+        "Snack",
+        "Regular Biscuit",
+        "Large Biscuit",
+        "4 piece",
+        "6 piece",
+        "10 piece",
+        "20 piece",
+        "40 piece",
+    }
+)
+
+# Last parenthesized qualifier such as "(Large)" or "(Regular Biscuit)",
+# together with the whitespace that separates it from the base name
+_PAREN_TAIL_RE = re.compile(r"\s*\(([^)]+)\)[^()]*$")
+
+
+@cache
 def extract_parentheses_info(item):
     """Extract info from parentheses and determine if it's a size"""
-    matches = re.findall(r"\(([^)]+)\)", item)
-    if not matches:
+    match = _PAREN_TAIL_RE.search(item)
+    if not match:
         return None, item, False
 
-    # Get the last parentheses (most specific)
-    paren_info = matches[-1]
-    base_item = item.rsplit(f"({paren_info})", 1)[0].strip()
+    # Use the last parentheses (most specific)
+    paren_info = match.group(1)
+    base_item = item[: match.start()]
 
     # Check if it's a size indicator
     is_size = paren_info in SIZE_INDICATORS
@@ -39,140 +48,162 @@ def extract_parentheses_info(item):
     return paren_info, base_item, is_size
 
 
+@cache
 def find_base_name(item):
     """Find the base name of an item, handling variations"""
     # Remove size info first
     paren_info, base_name, is_size = extract_parentheses_info(item)
 
     # Remove 'with' clauses
-    if " with " in base_name:
-        parts = base_name.split(" with ", 1)
-        if len(parts) > 0:
-            base_name = parts[0].strip()
-    if " without " in base_name:
-        parts = base_name.split(" without ", 1)
-        if len(parts) > 0:
-            base_name = parts[0].strip()
-
-    return base_name, paren_info if is_size else None
-
-
-# Read CSV
-menu_data = defaultdict(list)
-with open("menus/mcdonalds/mcdonalds-menu-items.csv") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        category = row["Category"]
-        item = row["Item"]
-        menu_data[category].append(item)
+    head, sep, _ = base_name.partition(" with ")
+    if sep:
+        base_name = head.strip()
+    head, sep, _ = base_name.partition(" without ")
+    if sep:
+        base_name = head.strip()
+
+    # Intern so base_groups keys shared by many rows hash and compare cheaply
+    return sys.intern(base_name), sys.intern(paren_info) if is_size else None
+
+
+def with_prefixes(name):
+    """Yield each prefix of name that is immediately followed by ' with'"""
+    start = name.find(" with")
+    while start != -1:
+        yield name[:start]
+        start = name.find(" with", start + 1)
+
+
+class CategoryBuilder:
+    """Incrementally group the items of one category into base items"""
+
+    def __init__(self):
+        self.items = []
+        # Group items by base name and size
+        self.base_groups = defaultdict(lambda: {"base": None, "variations": []})
 
-hierarchy = {}
-for category, items in menu_data.items():
-    # Group items by base name and size
-    base_groups = defaultdict(lambda: {"base": None, "variations": []})
+    def add_item(self, item):
+        """Record an item and assign it to its base group"""
+        # Interned so processed_items membership checks hit the identity path
+        item = sys.intern(item)
+        self.items.append(item)
 
-    for item in items:
         base_name, size_info = find_base_name(item)
         key = (base_name, size_info)
 
         # Determine if this is a variation or base
         if " with " in item or (" without " in item and size_info is None):
             # This is a variation
-            base_groups[key]["variations"].append(item)
+            self.base_groups[key]["variations"].append(item)
         else:
             # This is a base item (or could be)
-            if base_groups[key]["base"] is None:
-                base_groups[key]["base"] = item
-
-    # Build final structure
-    category_dict = {}
-
-    for (base_name, size_info), group_data in base_groups.items():
-        # Determine full base name
-        if size_info:
-            full_base_name = f"{base_name} ({size_info})"
-        else:
-            # Use the actual base item if available, otherwise construct
-            full_base_name = group_data["base"] if group_data["base"] else base_name
-
-        # Extract variations
-        variations = []
-        for var_item in group_data.get("variations", []):
-            var_paren, var_base, var_is_size = extract_parentheses_info(var_item)
-
-            if " with " in var_item:
-                parts = var_item.split(" with ", 1)
-                if len(parts) > 1:
-                    variation = parts[1]
+            if self.base_groups[key]["base"] is None:
+                self.base_groups[key]["base"] = item
+
+    def finalize(self):
+        """Build the sorted base item -> variations mapping for the category"""
+        # Build final structure
+        category_dict = {}
+
+        for (base_name, size_info), group_data in self.base_groups.items():
+            # Determine full base name
+            if size_info:
+                full_base_name = f"{base_name} ({size_info})"
+            else:
+                # Use the actual base item if available, otherwise construct
+                full_base_name = group_data["base"] if group_data["base"] else base_name
+
+            # Extract variations
+            size_needle = f"({size_info})" if size_info else None
+            variations = []
+            for var_item in group_data.get("variations", []):
+                _, sep, variation = var_item.partition(" with ")
+                prefix = ""
+                if not sep:
+                    _, sep, variation = var_item.partition(" without ")
+                    prefix = "without "
+
+                if sep:
                     # Remove size info if it matches
-                    if size_info and f"({size_info})" in variation:
-                        variation = variation.replace(f"({size_info})", "").strip()
-                    variations.append(variation)
-            elif " without " in var_item:
-                parts = var_item.split(" without ", 1)
-                if len(parts) > 1:
-                    variation = parts[1]
-                    if size_info and f"({size_info})" in variation:
-                        variation = variation.replace(f"({size_info})", "").strip()
-                    variations.append(f"without {variation}")
-
-        # Remove duplicates and sort
-        variations = sorted(set(variations))
-        category_dict[full_base_name] = variations
-
-    # Handle items that might be variations of items with different sizes
-    # For example: "Sausage Biscuit with Egg (Regular Biscuit)" -> base: "Sausage Biscuit (Regular Biscuit)"
-    final_dict = category_dict.copy()
-    processed_items = set(category_dict.keys())
-
-    # Check for cross-size variations
-    for item in items:
-        if item in processed_items:
-            continue
-
-        # Try to match to existing base
-        item_paren, item_base, item_is_size = extract_parentheses_info(item)
-
-        for base in list(final_dict.keys()):
+                    if size_needle and size_needle in variation:
+                        variation = variation.replace(size_needle, "").strip()
+                    variations.append(f"{prefix}{variation}")
+
+            # Remove duplicates (one hash pass) and sort in place
+            variations = list(dict.fromkeys(variations))
+            variations.sort()
+            category_dict[sys.intern(full_base_name)] = variations
+
+        # Handle items that might be variations of items with different sizes
+        # For example: "Sausage Biscuit with Egg (Regular Biscuit)" -> base: "Sausage Biscuit (Regular Biscuit)"
+        final_dict = category_dict.copy()
+        processed_items = set(category_dict.keys())
+
+        # Index bases by (base name, size) so matching an item is a dict lookup
+        # rather than a scan over every base. Only the earliest base per key is
+        # kept, since that is the one a scan in insertion order would find first.
+        base_index = {}
+        for position, base in enumerate(final_dict):
             base_paren, base_base, base_is_size = extract_parentheses_info(base)
-
-            # Check if item is a variation of this base
-            if base_is_size and item_is_size and base_paren == item_paren:
-                # Same size, check if base names match
-                if item_base.startswith(base_base + " with"):
-                    parts = item.split(" with ", 1)
-                    if len(parts) > 1:
-                        variation = parts[1]
-                        if base_paren and f"({base_paren})" in variation:
-                            variation = variation.replace(f"({base_paren})", "").strip()
-                        if variation not in final_dict[base]:
-                            final_dict[base].append(variation)
-                        processed_items.add(item)
-                        break
-            elif (
-                not base_is_size
-                and not item_is_size
-                and item_base.startswith(base_base + " with")
-            ):
-                # Neither has size, check if item is variation
-                parts = item.split(" with ", 1)
-                if len(parts) > 1:
-                    variation = parts[1]
+            base_key = (base_base, base_paren if base_is_size else None)
+            base_index.setdefault(base_key, (position, base))
+
+        # Check for cross-size variations
+        for item in self.items:
+            if item in processed_items:
+                continue
+
+            # Try to match to existing base
+            item_paren, item_base, item_is_size = extract_parentheses_info(item)
+            size_key = item_paren if item_is_size else None
+            size_needle = f"({size_key})" if size_key else None
+
+            _, sep, variation = item.partition(" with ")
+            if sep:
+                candidates = [
+                    base_index[(prefix, size_key)]
+                    for prefix in with_prefixes(item_base)
+                    if (prefix, size_key) in base_index
+                ]
+                if candidates:
+                    _, base = min(candidates)
+                    # Remove size info if it matches
+                    if size_needle and size_needle in variation:
+                        variation = variation.replace(size_needle, "").strip()
                     if variation not in final_dict[base]:
                         final_dict[base].append(variation)
                     processed_items.add(item)
-                    break
 
-        # If still not processed, add as standalone
-        if item not in processed_items:
-            final_dict[item] = []
-            processed_items.add(item)
+            # If still not processed, add as standalone
+            if item not in processed_items:
+                base_key = (item_base, size_key)
+                base_index.setdefault(base_key, (len(final_dict), item))
+                final_dict[item] = []
+                processed_items.add(item)
+
+        # Sort variations
+        for variations in final_dict.values():
+            variations.sort()
 
-    # Sort variations
-    for base in final_dict:
-        final_dict[base] = sorted(final_dict[base])
+        return dict(sorted(final_dict.items()))
 
-    hierarchy[category] = dict(sorted(final_dict.items()))
+
+# Read CSV, grouping each row as it streams in
+builders = {}
+with open("menus/mcdonalds/mcdonalds-menu-items.csv", buffering=1 << 16) as f:
+    reader = csv.reader(f)
+    header = next(reader)
+    category_col = header.index("Category")
+    item_col = header.index("Item")
+    for row in reader:
+        if not row:
+            continue  # Skip blank lines, as DictReader does
+        category = row[category_col]
+        if category not in builders:
+            builders[category] = CategoryBuilder()
+        builders[category].add_item(row[item_col])
+
+hierarchy = {category: builder.finalize() for category, builder in builders.items()}
 
 # Save JSON
 with open("menus/mcdonalds/menu-structure.json", "w") as f:
@@ -4,6 +4,8 @@ This module provides the command-line interface for running the drive-thru agent
 in various modes (console, dev, production) using LiveKit's built-in CLI.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 from livekit.agents import AgentServer, JobContext, JobProcess, cli
 from livekit.plugins import silero
@@ -21,8 +23,24 @@ setup_logging()
 
 
 def _prewarm(proc: JobProcess):
-    """Module-level prewarm function for loading VAD model."""
-    proc.userdata["vad"] = silero.VAD.load()
+    """Module-level prewarm function for loading VAD model, menu and STT/TTS.
+
+    The VAD weights load on a worker thread while the config, session handler
+    (which parses the menu) and STT/TTS clients are built, so the two overlap
+    instead of running back to back.
+    """
+    from factories import create_stt, create_tts
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        vad_future = executor.submit(silero.VAD.load)
+
+        config = AppConfig()
+        proc.userdata["config"] = config
+        proc.userdata["handler"] = DriveThruSessionHandler(config)
+        proc.userdata["stt"] = create_stt(config.pipeline)
+        proc.userdata["tts"] = create_tts(config.pipeline)
+
+        proc.userdata["vad"] = vad_future.result()
 
 
 async def _handle_rtc_session(ctx: JobContext):
@@ -31,11 +49,9 @@ async def _handle_rtc_session(ctx: JobContext):
     from livekit.plugins import noise_cancellation
     from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
-    from factories import create_stt, create_tts
-
-    # Initialize config and handler for this worker process
-    config = AppConfig()
-    handler = DriveThruSessionHandler(config)
+    # Config, handler and STT/TTS are built once per worker process in _prewarm
+    config: AppConfig = ctx.proc.userdata["config"]
+    handler: DriveThruSessionHandler = ctx.proc.userdata["handler"]
 
     session_id = ctx.room.name
 
@@ -49,9 +65,9 @@ async def _handle_rtc_session(ctx: JobContext):
     logger.debug(f"Agent LLM type: {type(drive_thru_agent.llm).__name__}")
     logger.debug(f"Agent has instructions: {len(drive_thru_agent.instructions) if hasattr(drive_thru_agent, 'instructions') else 'unknown'} chars")
 
-    # Create voice pipeline components
-    stt = create_stt(config.pipeline)
-    tts = create_tts(config.pipeline)
+    # Voice pipeline components built in _prewarm
+    stt = ctx.proc.userdata["stt"]
+    tts = ctx.proc.userdata["tts"]
 
     # Set up turn detection and VAD
     turn_detection = (
@@ -74,14 +90,14 @@ async def _handle_rtc_session(ctx: JobContext):
     logger.debug("AgentSession created successfully")
 
     # Configure room options
-    room_options = room_io.RoomOptions()
     if config.session.enable_noise_cancellation:
         logger.debug("Enabling noise cancellation")
-        room_options = room_io.RoomOptions(
-            audio_input=room_io.AudioInputOptions(
-                noise_cancellation=noise_cancellation.BVC(),
-            ),
+        audio_input = room_io.AudioInputOptions(
+            noise_cancellation=noise_cancellation.BVC(),
         )
+    else:
+        audio_input = NOT_GIVEN
+    room_options = room_io.RoomOptions(audio_input=audio_input)
 
     # Start the session
     logger.debug("Starting session with agent...")
@@ -5,6 +5,8 @@ McDonald's menu categories. These are used as a fallback when an item
 doesn't have predefined modifiers in the menu data.
 """
 
+from itertools import accumulate, pairwise
+
 from rapidfuzz import fuzz, process
 
 # Common modifiers by category
@@ -103,6 +105,35 @@ COMMON_MODIFIERS = {
     ],
 }
 
+# Struct-of-arrays view of COMMON_MODIFIERS: every modifier in one flat tuple,
+# with each category addressed by a slice into it
+_ALL_MODIFIERS: tuple[str, ...] = tuple(
+    modifier for modifiers in COMMON_MODIFIERS.values() for modifier in modifiers
+)
+_CATEGORY_OFFSETS = list(
+    accumulate((len(modifiers) for modifiers in COMMON_MODIFIERS.values()), initial=0)
+)
+_CATEGORY_SLICES: dict[str, slice] = {
+    category: slice(start, stop)
+    for category, (start, stop) in zip(
+        COMMON_MODIFIERS, pairwise(_CATEGORY_OFFSETS), strict=True
+    )
+}
+
+# Lowercase name -> canonical name, for case-insensitive exact lookups
+_LOWER_MAP: dict[str, dict[str, str]] = {
+    category: {modifier.lower(): modifier for modifier in _ALL_MODIFIERS[modifiers]}
+    for category, modifiers in _CATEGORY_SLICES.items()
+}
+
+# Fuzzy choices per category, in their original case. Scores are computed on
+# the raw strings: lowercasing both sides raises fuzz.ratio enough to accept
+# modifiers from the wrong category (e.g. "Extra Cheese" vs "Extra Ice")
+_COMMON_CHOICES: dict[str, tuple[str, ...]] = {
+    category: _ALL_MODIFIERS[modifiers]
+    for category, modifiers in _CATEGORY_SLICES.items()
+}
+
 
 def is_common_modifier_for_category(
     modifier: str, category: str, threshold: int = 85
@@ -132,23 +163,84 @@ def is_common_modifier_for_category(
     if category not in COMMON_MODIFIERS:
         return (False, None)
 
-    common_modifiers = COMMON_MODIFIERS[category]
-
     # Try exact match first (case-insensitive)
-    for common_mod in common_modifiers:
-        if common_mod.lower() == modifier.lower():
-            return (True, common_mod)
+    canonical = _LOWER_MAP[category].get(modifier.lower())
+    if canonical is not None:
+        return (True, canonical)
 
-    # Fall back to fuzzy matching
+    # Fall back to fuzzy matching against the raw choices
     result = process.extractOne(
-        modifier, common_modifiers, scorer=fuzz.ratio, score_cutoff=threshold
+        modifier,
+        _COMMON_CHOICES[category],
+        scorer=fuzz.ratio,
+        processor=None,
+        score_cutoff=threshold,
     )
 
     if result is None:
         return (False, None)
 
-    matched_modifier, score, _ = result
-    return (True, matched_modifier)
+    _, _, index = result
+    return (True, _ALL_MODIFIERS[_CATEGORY_SLICES[category].start + index])
+
+
+def are_common_modifiers_for_category(
+    modifiers: list[str], category: str, threshold: int = 85
+) -> list[tuple[bool, str | None]]:
+    """Check several modifiers against the common modifiers for a category.
+
+    Batch form of is_common_modifier_for_category: exact matches are resolved
+    by lookup, and all remaining modifiers are scored against the category's
+    choices in a single rapidfuzz cdist call.
+
+    Args:
+        modifiers: The modifiers to check
+        category: The menu category (e.g., "Beef & Pork")
+        threshold: Minimum fuzzy match score (0-100) to accept
+
+    Returns:
+        List of (is_valid, matched_modifier_name) tuples, one per modifier,
+        in the same order as the input
+
+    Examples:
+        >>> are_common_modifiers_for_category(["extra cheese", "anchovies"], "Beef & Pork")
+        [(True, "Extra Cheese"), (False, None)]
+    """
+    if category not in COMMON_MODIFIERS:
+        return [(False, None)] * len(modifiers)
+
+    lower_map = _LOWER_MAP[category]
+
+    results: list[tuple[bool, str | None]] = []
+    unmatched: list[int] = []
+    for position, modifier in enumerate(modifiers):
+        canonical = lower_map.get(modifier.lower())
+        if canonical is not None:
+            results.append((True, canonical))
+        else:
+            results.append((False, None))
+            unmatched.append(position)
+
+    if not unmatched:
+        return results
+
+    # Score every unmatched modifier against every choice in one call
+    scores = process.cdist(
+        [modifiers[position] for position in unmatched],
+        _COMMON_CHOICES[category],
+        scorer=fuzz.ratio,
+        processor=None,
+        score_cutoff=threshold,
+    )
+    best_indices = scores.argmax(axis=1)
+    start = _CATEGORY_SLICES[category].start
+
+    for row, position in enumerate(unmatched):
+        best_index = best_indices[row]
+        if scores[row, best_index] >= threshold:
+            results[position] = (True, _ALL_MODIFIERS[start + best_index])
+
+    return results
 
 
 def get_common_modifiers_for_category(category: str) -> list[str]:
@@ -158,7 +250,7 @@ def get_common_modifiers_for_category(category: str) -> list[str]:
         category: The menu category (e.g., "Beef & Pork")
 
     Returns:
-        List of common modifier names for the category, or empty list if
+        New list of common modifier names for the category, or empty list if
         category not found
 
     Examples:
@@ -167,4 +259,7 @@ def get_common_modifiers_for_category(category: str) -> list[str]:
         >>> get_common_modifiers_for_category("Unknown Category")
         []
     """
-    return COMMON_MODIFIERS.get(category, [])
+    modifiers = _CATEGORY_SLICES.get(category)
+    if modifiers is None:
+        return []
+    return list(_ALL_MODIFIERS[modifiers])
@@ -11,7 +11,10 @@ Key Principles:
 - Defines Persona: Sets instructions and conversation style
 """
 
+from typing import ClassVar
+
 from livekit.agents import Agent
+from livekit.agents.llm import FunctionTool
 from loguru import logger
 
 from drive_thru_llm import DriveThruLLM
@@ -33,58 +36,10 @@ class DriveThruAgent(Agent):
     components for a complete drive-thru ordering experience.
     """
 
-    def __init__(
-        self,
-        session_id: str,
-        llm: DriveThruLLM,
-        menu_provider: MenuProvider,
-        output_dir: str = "orders",
-    ) -> None:
-        """Initialize drive-thru agent.
-
-        Args:
-            session_id: Unique session ID
-            llm: DriveThruLLM (wrapped LLM)
-            menu_provider: MenuProvider for menu access
-            output_dir: Directory for order files
-        """
-        # Store dependencies first
-        self._llm = llm
-        self._menu_provider = menu_provider
-        self._session_id = session_id
-
-        # Create OrderStateManager for this session (agent owns it)
-        self._order_state = OrderStateManager(
-            session_id=session_id, output_dir=output_dir
-        )
-
-        # Create tools with dependencies injected BEFORE calling super().__init__()
-        self._tools = create_order_tools(
-            order_state=self._order_state, menu_provider=self._menu_provider
-        )
-
-        # Log tool creation for diagnostics
-        logger.info(f"Created {len(self._tools)} tools for drive-thru agent")
-        logger.debug(f"Tool types: {[type(t).__name__ for t in self._tools]}")
-
-        # Initialize Agent with instructions, tools, AND LLM
-        logger.debug(f"Initializing Agent with LLM type: {type(llm).__name__}")
-        logger.debug(f"Number of tools being passed: {len(self._tools)}")
-
-        super().__init__(
-            instructions=self._get_instructions(), tools=self._tools, llm=llm
-        )
-
-        logger.info(f"DriveThruAgent initialized successfully for session {session_id}")
-
-    def _get_instructions(self) -> str:
-        """Get agent instructions/persona.
-
-        Returns:
-            Complete agent instructions including persona, responsibilities,
-            and guidelines.
-        """
-        return """You are a friendly and efficient McDonald's drive-thru order taker.
+    # Agent persona, shared by every session
+    INSTRUCTIONS: ClassVar[
+        str
+    ] = """You are a friendly and efficient McDonald's drive-thru order taker.
 
 Your responsibilities:
 1. Greet customers warmly when they arrive
@@ -148,6 +103,62 @@ Guidelines:
 Remember: You have access to the complete menu through context injection.
 """
 
+    def __init__(
+        self,
+        session_id: str,
+        llm: DriveThruLLM,
+        menu_provider: MenuProvider,
+        output_dir: str = "orders",
+    ) -> None:
+        """Initialize drive-thru agent.
+
+        Args:
+            session_id: Unique session ID
+            llm: DriveThruLLM (wrapped LLM)
+            menu_provider: MenuProvider for menu access
+            output_dir: Directory for order files
+        """
+        # Store dependencies first
+        self._llm = llm
+        self._menu_provider = menu_provider
+        self._session_id = session_id
+
+        # Create OrderStateManager for this session (agent owns it)
+        self._order_state = OrderStateManager(
+            session_id=session_id, output_dir=output_dir
+        )
+
+        # Create tools with dependencies injected BEFORE calling super().__init__()
+        self._tools = create_order_tools(
+            order_state=self._order_state, menu_provider=self._menu_provider
+        )
+
+        # Index tools by name so callers can fetch one without scanning the list
+        self._tools_by_name = {tool.info.name: tool for tool in self._tools}
+
+        # Log tool creation for diagnostics
+        logger.info(f"Created {len(self._tools)} tools for drive-thru agent")
+        logger.debug(f"Tool types: {[type(t).__name__ for t in self._tools]}")
+
+        # Initialize Agent with instructions, tools, AND LLM
+        logger.debug(f"Initializing Agent with LLM type: {type(llm).__name__}")
+        logger.debug(f"Number of tools being passed: {len(self._tools)}")
+
+        super().__init__(
+            instructions=self._get_instructions(), tools=self._tools, llm=llm
+        )
+
+        logger.info(f"DriveThruAgent initialized successfully for session {session_id}")
+
+    def _get_instructions(self) -> str:
+        """Get agent instructions/persona.
+
+        Returns:
+            Complete agent instructions including persona, responsibilities,
+            and guidelines.
+        """
+        return self.INSTRUCTIONS
+
     @property
     def agent(self) -> Agent:
         """Get the LiveKit Agent instance.
@@ -184,6 +195,17 @@ Remember: You have access to the complete menu through context injection.
         """
         return self._tools
 
+    def get_tool(self, name: str) -> FunctionTool | None:
+        """Get an order management tool by name.
+
+        Args:
+            name: Tool name (e.g., "add_item_to_order")
+
+        Returns:
+            The FunctionTool instance, or None if no tool has that name
+        """
+        return self._tools_by_name.get(name)
+
     async def close(self) -> None:
         """Clean up resources.
 
@@ -5,14 +5,39 @@ relevant menu context based on keywords extracted from user messages. This helps
 ground the LLM in actual menu items and reduces hallucination.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
-from livekit.agents.llm import LLM, ChatContext, LLMStream
+from livekit.agents.llm import LLM, ChatContext, ChatMessage, LLMStream
 from loguru import logger
 
 from menu_provider import MenuProvider
 from menus.mcdonalds.models import Item
 
+# Common words dropped from user messages before menu search
+_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "i",
+        "want",
+        "a",
+        "an",
+        "the",
+        "please",
+        "thanks",
+        "and",
+        "with",
+    }
+)
+
+# Fixed ID for the injected menu message, so a context that already carries
+# one (e.g. from an earlier turn) has it replaced rather than accumulated
+_MENU_CONTEXT_ID = "drive_thru_menu_context"
+
+# Upper bound on rendered context texts kept per LLM; each distinct search
+# result is a new key, so the cache evicts least recently used entries
+_MAX_CONTEXT_TEXTS = 256
+
 
 class DriveThruLLM(LLM):
     """Stateless LLM wrapper that injects menu context.
@@ -44,6 +69,16 @@ class DriveThruLLM(LLM):
         self._menu_provider = menu_provider
         self._max_context_items = max_context_items
 
+        # The menu is static, so search results depend only on the keywords;
+        # cache them so repeated utterances skip the menu search
+        self._search_keywords = lru_cache(maxsize=512)(self._search_keywords_uncached)
+
+        # Formatted context line per item name; menu items never change
+        self._context_lines: dict[str, str] = {}
+        # Rendered context text per sequence of item names, so a turn that
+        # finds the same items as an earlier one reuses the joined text
+        self._context_texts: OrderedDict[tuple[str, ...], str] = OrderedDict()
+
     @logger.catch
     def chat(
         self,
@@ -105,27 +140,14 @@ class DriveThruLLM(LLM):
         Returns:
             Latest user message content, or None if no user messages exist
         """
-        # Iterate in reverse to find the last user message
+        # Iterate in reverse to find the last user message. Chat items are
+        # concrete types, so dispatch on type rather than probing attributes.
         for item in reversed(chat_ctx.items):
-            if (
-                hasattr(item, "role")
-                and item.role == "user"
-                and hasattr(item, "content")
-            ):
-                # Extract text content from the item
-                # Content might be a list of content parts or a string
-                content = item.content
-                if isinstance(content, list):
-                    # Join all text parts
-                    text_parts = []
-                    for part in content:
-                        if hasattr(part, "text"):
-                            text_parts.append(part.text)
-                        elif isinstance(part, str):
-                            text_parts.append(part)
-                    return " ".join(text_parts)
-                elif isinstance(content, str):
-                    return content
+            if isinstance(item, ChatMessage) and item.role == "user":
+                # Join the text parts; images and audio are skipped
+                return " ".join(
+                    part for part in item.content if isinstance(part, str)
+                )
 
         return None
 
@@ -148,24 +170,8 @@ class DriveThruLLM(LLM):
         if not message:
             return []
 
-        # Lowercase and split
-        words = message.lower().split()
-
-        # Remove common stopwords
-        stopwords = {
-            "i",
-            "want",
-            "a",
-            "an",
-            "the",
-            "please",
-            "thanks",
-            "and",
-            "with",
-        }
-        keywords = [w for w in words if w not in stopwords]
-
-        return keywords
+        # Lowercase, split and remove common stopwords
+        return [w for w in message.lower().split() if w not in _STOPWORDS]
 
     @logger.catch
     def _find_relevant_items(self, keywords: list[str]) -> list[Item]:
@@ -181,6 +187,19 @@ class DriveThruLLM(LLM):
             - Search for each keyword
             - Deduplicate results
             - Limit to max_context_items
+            - Cache results per keyword sequence
+        """
+        # Repeated keywords add no matches, so drop them to share cache entries
+        return list(self._search_keywords(tuple(dict.fromkeys(keywords))))
+
+    def _search_keywords_uncached(self, keywords: tuple[str, ...]) -> tuple[Item, ...]:
+        """Search the menu for each keyword (backs the _search_keywords cache).
+
+        Args:
+            keywords: Distinct keywords, in utterance order
+
+        Returns:
+            Relevant menu items (up to max_context_items)
         """
         all_matches: list[Item] = []
         seen_items: set[str] = set()
@@ -198,7 +217,7 @@ class DriveThruLLM(LLM):
             if len(all_matches) >= self._max_context_items:
                 break
 
-        return all_matches
+        return tuple(all_matches)
 
     @logger.catch
     def _inject_menu_context(
@@ -218,49 +237,27 @@ class DriveThruLLM(LLM):
         # Format items for injection
         items_text = self._format_items_for_context(items)
 
-        # Create a new context and rebuild with menu context injected
-        new_ctx = ChatContext()
-
-        # Helper function to extract text from content
-        def get_text_content(content: Any) -> str:
-            if isinstance(content, str):
-                return content
-            if isinstance(content, list):
-                text_parts = []
-                for part in content:
-                    if hasattr(part, "text"):
-                        text_parts.append(part.text)
-                    elif isinstance(part, str):
-                        text_parts.append(part)
-                return " ".join(text_parts)
-            return ""
+        menu_message = ChatMessage(
+            id=_MENU_CONTEXT_ID,
+            role="system",
+            content=[f"Relevant menu items:\n{items_text}"],
+        )
 
-        # Add items in order: first item, then menu context, then rest
-        for i, item in enumerate(chat_ctx.items):
-            # Only process items with a 'role' attribute (chat messages)
-            # Skip FunctionCall/FunctionCallOutput objects - they don't need menu context
-            if not hasattr(item, "role"):
-                continue
-
-            if i == 0:
-                # Add the first message (usually system prompt)
-                new_ctx.add_message(
-                    role=item.role,
-                    content=get_text_content(item.content),
-                )
-                # After first message, inject menu context
-                new_ctx.add_message(
-                    role="system",
-                    content=f"Relevant menu items:\n{items_text}",
-                )
-            else:
-                # Add remaining messages
-                new_ctx.add_message(
-                    role=item.role,
-                    content=get_text_content(item.content),
-                )
+        # Reuse the original message objects rather than re-adding each one.
+        # Only chat messages are kept; FunctionCall/FunctionCallOutput objects
+        # don't need menu context, and any previously injected menu message
+        # is dropped so at most one is ever present.
+        messages = [
+            item
+            for item in chat_ctx.items
+            if isinstance(item, ChatMessage) and item.id != _MENU_CONTEXT_ID
+        ]
 
-        return new_ctx
+        # Menu context goes right after the first message (usually system prompt)
+        if chat_ctx.items and isinstance(chat_ctx.items[0], ChatMessage):
+            messages.insert(1, menu_message)
+
+        return ChatContext(items=messages)
 
     @logger.catch
     def _format_items_for_context(self, items: list[Item]) -> str:
@@ -280,14 +277,37 @@ class DriveThruLLM(LLM):
         if not items:
             return ""
 
-        lines = []
-        for item in items:
+        key = tuple(item.item_name for item in items)
+        text = self._context_texts.get(key)
+        if text is None:
+            text = "\n".join(self._format_item_for_context(item) for item in items)
+            self._context_texts[key] = text
+            if len(self._context_texts) > _MAX_CONTEXT_TEXTS:
+                self._context_texts.popitem(last=False)
+        else:
+            self._context_texts.move_to_end(key)
+
+        return text
+
+    def _format_item_for_context(self, item: Item) -> str:
+        """Format one menu item for LLM context, formatting each item only once.
+
+        Args:
+            item: Menu item
+
+        Returns:
+            The item's line, followed by its modifiers line if it has any
+        """
+        line = self._context_lines.get(item.item_name)
+        if line is None:
             # Group by category for clarity
-            lines.append(f"- {item.item_name} ({item.category_name})")
+            line = f"- {item.item_name} ({item.category_name})"
 
             # Optionally include modifiers
             if item.modifiers:
                 modifier_names = [m.modifier_name for m in item.modifiers]
-                lines.append(f"  Modifiers: {', '.join(modifier_names)}")
+                line += f"\n  Modifiers: {', '.join(modifier_names)}"
+
+            self._context_lines[item.item_name] = line
 
-        return "\n".join(lines)
+        return line
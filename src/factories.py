@@ -7,30 +7,43 @@ removing that layer, these factories still provide separation of concerns:
 - `agent.py` wires the app together
 
 The returned objects are concrete LiveKit Inference implementations.
+`livekit.agents.inference` is imported inside each factory, so importing this
+module (or `config`) doesn't pull in the LiveKit runtime until a component is
+actually built.
 """
 
-from livekit.agents import inference
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
 from config import PipelineConfig
 
+if TYPE_CHECKING:
+    from livekit.agents import inference
+
 
-def create_stt(config: PipelineConfig) -> inference.STT:
+def create_stt(config: PipelineConfig) -> "inference.STT":
     """Create an STT component from configuration."""
+    from livekit.agents import inference
+
     logger.info(
         f"Creating STT with model: {config.stt_model}, lang: {config.stt_language}"
     )
     return inference.STT(model=config.stt_model, language=config.stt_language)
 
 
-def create_llm(config: PipelineConfig) -> inference.LLM:
+def create_llm(config: PipelineConfig) -> "inference.LLM":
     """Create an LLM component from configuration."""
+    from livekit.agents import inference
+
     logger.info(f"Creating LLM with model: {config.llm_model}")
     return inference.LLM(model=config.llm_model)
 
 
-def create_tts(config: PipelineConfig) -> inference.TTS:
+def create_tts(config: PipelineConfig) -> "inference.TTS":
     """Create a TTS component from configuration."""
+    from livekit.agents import inference
+
     logger.info(
         f"Creating TTS with model: {config.tts_model}, voice: {config.tts_voice}"
     )
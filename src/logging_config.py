@@ -13,11 +13,14 @@ from pathlib import Path
 from loguru import logger
 
 
-def setup_logging(log_dir: str = "logs") -> None:
+def setup_logging(log_dir: str = "logs", debug: bool = False) -> None:
     """Configure loguru logging with file rotation.
 
     Args:
         log_dir: Directory for log files (default: "logs")
+        debug: Include extended tracebacks with variable values in exception
+            logs (default: False). This is slow and can write customer data
+            to the logs, so it is off unless debugging.
     """
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
@@ -32,8 +35,8 @@ def setup_logging(log_dir: str = "logs") -> None:
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level="INFO",
         colorize=True,
-        backtrace=True,
-        diagnose=True,
+        backtrace=debug,
+        diagnose=debug,
         enqueue=True,
     )
 
@@ -46,12 +49,11 @@ def setup_logging(log_dir: str = "logs") -> None:
         retention="2 days",  # Keep logs for 2 days
         compression="zip",  # Compress rotated logs
         enqueue=True,  # Thread-safe logging
-        backtrace=True,
-        diagnose=True,
-
+        backtrace=debug,
+        diagnose=debug,
     )
 
     logger.info(f"Logging configured: console (INFO), files in {log_path} (DEBUG)")
     logger.debug(
-        f"File rotation: every 4 hours, retention: 2 days, compression: enabled"
+        "File rotation: every 4 hours, retention: 2 days, compression: enabled"
     )
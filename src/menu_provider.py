@@ -4,6 +4,9 @@ This module provides the MenuProvider class, which loads and queries
 the McDonald's menu data in a thread-safe, immutable manner.
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 
 from menus.mcdonalds.models import Item, Menu
@@ -13,7 +16,8 @@ class MenuProvider:
     """Read-only menu data provider.
 
     Loads the McDonald's menu from JSON and provides query methods.
-    All methods return immutable data (copies, not references).
+    All methods return immutable data: the menu models are frozen, so items
+    are shared rather than copied.
 
     Thread-safe: Can be shared across multiple agents/sessions.
     """
@@ -41,6 +45,10 @@ class MenuProvider:
         # Build lookup indices for fast queries
         self._build_indices()
 
+        # The menu never changes, so a keyword's matches never do either;
+        # repeat searches (common across turns and sessions) become a lookup
+        self._scan_item_names = lru_cache(maxsize=1024)(self._scan_item_names_uncached)
+
     def search_items(self, keyword: str, category: str | None = None) -> list[Item]:
         """Search for items by keyword, optionally filtered by category.
 
@@ -49,7 +57,7 @@ class MenuProvider:
             category: Optional category to filter by
 
         Returns:
-            List of matching items (copies, not references)
+            List of matching items
 
         Examples:
             - search_items("mac") → [Big Mac, Egg McMuffin, ...]
@@ -57,21 +65,16 @@ class MenuProvider:
             - search_items("coffee", category="Coffee & Tea") → [coffee items]
         """
         keyword_lower = keyword.lower()
-        results = []
 
-        # Get items to search
+        # Restrict the scan to the category's span of the search text
         if category:
-            items_to_search = self.get_category(category)
+            if category not in self._category_spans:
+                return []
+            first, stop = self._category_spans[category]
         else:
-            items_to_search = self._get_all_items()
-
-        # Search item names (case-insensitive substring match)
-        for item in items_to_search:
-            if keyword_lower in item.item_name.lower():
-                # Return copy, not reference
-                results.append(item.model_copy())
+            first, stop = 0, len(self._all_items)
 
-        return results
+        return list(self._scan_item_names(keyword_lower, first, stop))
 
     def get_category(self, category_name: str) -> list[Item]:
         """Get all items in a category.
@@ -86,11 +89,7 @@ class MenuProvider:
             - get_category("Breakfast") → [Egg McMuffin, Hash Browns, ...]
             - get_category("Invalid") → []
         """
-        # Use index for O(1) lookup
-        items = self._category_index.get(category_name, [])
-
-        # Return copies, not references
-        return [item.model_copy() for item in items]
+        return list(self._category_items(category_name))
 
     def get_item(self, category_name: str, item_name: str) -> Item | None:
         """Get a specific item by category and name.
@@ -106,11 +105,11 @@ class MenuProvider:
             - get_item("Beef & Pork", "Big Mac") → Item(...)
             - get_item("Breakfast", "Big Mac") → None (wrong category)
         """
-        items = self.get_category(category_name)
+        item_name_lower = item_name.lower()
 
-        for item in items:
-            if item.item_name.lower() == item_name.lower():
-                return item.model_copy()  # Return copy
+        for item in self._category_items(category_name):
+            if item.name_lower == item_name_lower:
+                return item
 
         return None
 
@@ -123,34 +122,83 @@ class MenuProvider:
         Example:
             → ["Breakfast", "Beef & Pork", "Chicken & Fish", ...]
         """
-        return list(self._category_index.keys())
+        return list(self._category_spans)
 
     def get_menu(self) -> Menu:
         """Get the complete menu.
 
         Returns:
-            Complete Menu object (immutable copy)
+            Complete Menu object (deep copy, so callers can't corrupt the
+            shared menu or the provider's indices)
         """
         return self._menu.model_copy(deep=True)
 
     def get_items_count(self) -> int:
         """Get total number of items across all categories."""
-        return sum(len(items) for items in self._category_index.values())
+        return len(self._all_items)
 
     def category_exists(self, category_name: str) -> bool:
         """Check if a category exists."""
-        return category_name in self._category_index
+        return category_name in self._category_spans
 
     def _build_indices(self) -> None:
         """Build lookup indices for fast queries (called once on init)."""
-        self._category_index: dict[str, list[Item]] = {}
+        # Every item in one flat tuple, in menu order, with each category
+        # addressed by its [first, stop) span of that tuple
+        all_items: list[Item] = []
+        self._category_spans: dict[str, tuple[int, int]] = {}
 
         for category_name, items in self._menu.categories.items():
-            self._category_index[category_name] = items
-
-    def _get_all_items(self) -> list[Item]:
-        """Get all items across all categories."""
-        all_items = []
-        for items in self._category_index.values():
+            first = len(all_items)
             all_items.extend(items)
-        return all_items
+            self._category_spans[category_name] = (first, len(all_items))
+
+        self._all_items: tuple[Item, ...] = tuple(all_items)
+
+        # Search index: every lowercase item name joined into one string, so a
+        # keyword search is a few str.find scans in C instead of a Python loop
+        # lowercasing each name. _search_offsets[i] is where item i's name
+        # starts; the final entry is a sentinel one past the end of the text.
+        names = [item.name_lower for item in self._all_items]
+        self._search_offsets = list(
+            accumulate((len(name) + 1 for name in names), initial=0)
+        )
+        self._search_text = "\n".join(names)
+
+    def _category_items(self, category_name: str) -> tuple[Item, ...]:
+        """Get the items of a category as a slice of the flat item tuple."""
+        span = self._category_spans.get(category_name)
+        if span is None:
+            return ()
+        first, stop = span
+        return self._all_items[first:stop]
+
+    def _scan_item_names_uncached(
+        self, keyword_lower: str, first: int, stop: int
+    ) -> tuple[Item, ...]:
+        """Find items in [first, stop) whose lowercase name contains keyword_lower.
+
+        Items are returned in menu order, each at most once. Backs the
+        _scan_item_names cache.
+        """
+        # Names never contain a newline, so such a keyword cannot match
+        if first == stop or "\n" in keyword_lower:
+            return ()
+
+        text = self._search_text
+        offsets = self._search_offsets
+        end = offsets[stop] - 1
+        matches: list[Item] = []
+
+        position = text.find(keyword_lower, offsets[first], end)
+        while position != -1:
+            index = bisect_right(offsets, position, first, stop) - 1
+            matches.append(self._all_items[index])
+            # Resume at the next name so each item is reported once
+            position = text.find(keyword_lower, offsets[index + 1], end)
+
+        return tuple(matches)
+
+    def _get_all_items(self) -> tuple[Item, ...]:
+        """Get all items across all categories, in menu order."""
+        return self._all_items
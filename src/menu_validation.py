@@ -10,8 +10,8 @@ from dataclasses import dataclass
 from loguru import logger
 from rapidfuzz import fuzz, process
 
-from common_modifiers import is_common_modifier_for_category
-from menus.mcdonalds.models import Item, Menu
+from common_modifiers import are_common_modifiers_for_category
+from menus.mcdonalds.models import Item, LowercaseIndex, Menu
 
 
 @dataclass
@@ -32,7 +32,10 @@ class ValidationResult:
 
 
 def fuzzy_match_item(
-    item_name: str, menu_items: list[Item], threshold: int = 85
+    item_name: str,
+    menu_items: list[Item],
+    threshold: int = 85,
+    precomputed: LowercaseIndex | None = None,
 ) -> ValidationResult:
     """
     Fuzzy match an item name against menu items.
@@ -41,6 +44,7 @@ def fuzzy_match_item(
         item_name: The item name to match (e.g., "big mac", "Big Mack")
         menu_items: List of menu items to search
         threshold: Minimum score (0-100) to accept match
+        precomputed: Lowercase index over menu_items, built here if not given
 
     Returns:
         ValidationResult with best match if above threshold
@@ -58,17 +62,15 @@ def fuzzy_match_item(
     if not menu_items:
         return ValidationResult(is_valid=False, error_message="Menu is empty")
 
-    # Extract item names for matching (use lowercase for case-insensitive matching)
-    item_name_mapping = {item.item_name: item for item in menu_items}
-    item_names = list(item_name_mapping.keys())
-
-    # Create lowercase mapping for case-insensitive search
-    lowercase_mapping = {name.lower(): name for name in item_names}
-    lowercase_names = list(lowercase_mapping.keys())
+    # Lowercase names for case-insensitive matching
+    index = precomputed or LowercaseIndex.from_items(menu_items)
 
     # Use rapidfuzz to find best match (case-insensitive)
     result = process.extractOne(
-        item_name.lower(), lowercase_names, scorer=fuzz.ratio, score_cutoff=threshold
+        item_name.lower(),
+        index.names_lower,
+        scorer=fuzz.ratio,
+        score_cutoff=threshold,
     )
 
     if result is None:
@@ -78,9 +80,7 @@ def fuzzy_match_item(
         )
 
     matched_lowercase, score, _ = result
-    # Map back to original case
-    original_name = lowercase_mapping[matched_lowercase]
-    matched_item = item_name_mapping[original_name]
+    matched_item = index.name_to_item[matched_lowercase]
 
     return ValidationResult(
         is_valid=True, matched_item=matched_item, confidence_score=float(score)
@@ -110,14 +110,19 @@ def validate_item_exists(item_name: str, category: str, menu: Menu) -> Validatio
         )
 
     # Try exact match first (case-insensitive)
+    item_name_lower = item_name.lower()
     for item in category_items:
-        if item.item_name.lower() == item_name.lower():
+        if item.name_lower == item_name_lower:
             return ValidationResult(
                 is_valid=True, matched_item=item, confidence_score=100.0
             )
 
-    # Fall back to fuzzy matching
-    return fuzzy_match_item(item_name, category_items)
+    # Fall back to fuzzy matching against the menu's cached category index
+    return fuzzy_match_item(
+        item_name,
+        category_items,
+        precomputed=menu.get_category_lowercase_index(category),
+    )
 
 
 def validate_modifiers(
@@ -152,32 +157,36 @@ def validate_modifiers(
     # Check if item has predefined modifiers
     if item.modifiers:
         # Use strict validation with predefined modifiers
-        available_modifier_names = [m.modifier_name for m in item.modifiers]
+        available_modifier_names = item.modifier_names
+        modifier_lookup = item.modifier_lookup
 
-        invalid_modifiers = []
-        for requested in requested_modifiers:
-            # Try exact match first
-            exact_match = any(
-                m.lower() == requested.lower() for m in available_modifier_names
-            )
-            if exact_match:
-                continue
+        # Try exact match first (case-insensitive)
+        unmatched = [
+            requested
+            for requested in requested_modifiers
+            if requested.lower() not in modifier_lookup
+        ]
 
-            # Try fuzzy match
-            result = process.extractOne(
-                requested,
+        # Fuzzy match the rest against every available modifier in one call
+        invalid_modifiers = []
+        if unmatched:
+            scores = process.cdist(
+                unmatched,
                 available_modifier_names,
                 scorer=fuzz.ratio,
                 score_cutoff=fuzzy_threshold,
             )
-
-            if result is None:
-                invalid_modifiers.append(requested)
+            best_scores = scores.max(axis=1)
+            invalid_modifiers = [
+                requested
+                for requested, best in zip(unmatched, best_scores, strict=True)
+                if best < fuzzy_threshold
+            ]
 
         if invalid_modifiers:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Invalid modifiers for '{item.item_name}': {invalid_modifiers}. Available modifiers: {available_modifier_names}",
+                error_message=f"Invalid modifiers for '{item.item_name}': {invalid_modifiers}. Available modifiers: {list(available_modifier_names)}",
             )
 
         return ValidationResult(
@@ -190,13 +199,14 @@ def validate_modifiers(
         f"using common modifiers for category '{item.category_name}'"
     )
 
-    invalid_modifiers = []
-    for requested in requested_modifiers:
-        is_valid, matched_name = is_common_modifier_for_category(
-            requested, item.category_name, threshold=fuzzy_threshold
-        )
-        if not is_valid:
-            invalid_modifiers.append(requested)
+    matches = are_common_modifiers_for_category(
+        requested_modifiers, item.category_name, threshold=fuzzy_threshold
+    )
+    invalid_modifiers = [
+        requested
+        for requested, (is_valid, _) in zip(requested_modifiers, matches, strict=True)
+        if not is_valid
+    ]
 
     if invalid_modifiers:
         return ValidationResult(
@@ -4,6 +4,6 @@ This module provides Pydantic v2 models for representing McDonald's menu items,
 modifiers, and complete menu structure.
 """
 
-from menus.mcdonalds.models import Item, Menu, Modifier
+from menus.mcdonalds.models import Item, LowercaseIndex, Menu, Modifier
 
-__all__ = ["Item", "Menu", "Modifier"]
+__all__ = ["Item", "LowercaseIndex", "Menu", "Modifier"]
@@ -5,11 +5,15 @@ This module provides models for representing menu items, modifiers, and the comp
 All models support JSON serialization and deserialization.
 """
 
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Modifier(BaseModel):
@@ -20,6 +24,8 @@ class Modifier(BaseModel):
         modifier_id: A unique identifier for this modifier (auto-generated UUID)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     modifier_name: str
     modifier_id: str = Field(default_factory=lambda: str(uuid4()))
 
@@ -34,6 +40,10 @@ class Modifier(BaseModel):
         return self.modifier_id == other.modifier_id
 
 
+# Item cached_property names, dropped whenever the fields they derive from may change
+_ITEM_CACHED_LOOKUPS = ("name_lower", "modifier_names", "modifier_lookup")
+
+
 class Item(BaseModel):
     """A menu item with its category and available modifiers.
 
@@ -44,8 +54,14 @@ class Item(BaseModel):
         modifiers: List of available modifiers/variations for this item
         quantity: Number of this item (default: 1)
         item_id: Unique identifier for this item instance (auto-generated UUID)
+
+    Fields can't be reassigned once an item is built (the modifiers list can
+    still be mutated in place); use model_copy(update=...) to derive a changed
+    item.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     category_name: str
     item_name: str
     available_as_base: bool
@@ -66,8 +82,50 @@ class Item(BaseModel):
         """
         modifier = Modifier(modifier_name=modifier_name)
         self.modifiers.append(modifier)
+
+        # Drop derived lookups so they are rebuilt with the new modifier
+        self._drop_cached_lookups()
         return modifier
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "Item":
+        """Copy this item, recomputing derived lookups on the copy.
+
+        pydantic copies the instance __dict__, which is also where the
+        cached_property values below live, so they are dropped here rather
+        than carried over stale when update changes the item's fields.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._drop_cached_lookups()
+        return copied
+
+    def _drop_cached_lookups(self) -> None:
+        """Forget cached derived lookups so they are rebuilt on next access."""
+        for name in _ITEM_CACHED_LOOKUPS:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercase item name, for case-insensitive comparisons.
+
+        Interned, since it keys the lookup dicts built over the menu.
+        """
+        return sys.intern(self.item_name.lower())
+
+    @cached_property
+    def modifier_names(self) -> tuple[str, ...]:
+        """Names of the item's modifiers, in menu order."""
+        return tuple(m.modifier_name for m in self.modifiers)
+
+    @cached_property
+    def modifier_lookup(self) -> dict[str, str]:
+        """Map of lowercase modifier name to modifier name."""
+        lookup: dict[str, str] = {}
+        for name in self.modifier_names:
+            lookup.setdefault(name.lower(), name)
+        return lookup
+
     def __add__(self, other: "Item") -> "Item":
         """Combine two identical items by adding their quantities.
 
@@ -126,6 +184,32 @@ class Item(BaseModel):
         return cls.model_validate_json(json_str)
 
 
+@dataclass(frozen=True)
+class LowercaseIndex:
+    """Case-insensitive name lookup for a group of items, built once per group.
+
+    Attributes:
+        names_lower: Unique lowercase item names, in menu order
+        name_to_item: Map of lowercase item name to the matching item
+    """
+
+    names_lower: tuple[str, ...]
+    name_to_item: dict[str, Item]
+
+    @classmethod
+    def from_items(cls, items: list[Item]) -> "LowercaseIndex":
+        """Build an index over items; later duplicates of a name win."""
+        item_name_mapping = {item.item_name: item for item in items}
+        lowercase_mapping = {name.lower(): name for name in item_name_mapping}
+        return cls(
+            names_lower=tuple(lowercase_mapping),
+            name_to_item={
+                lower: item_name_mapping[name]
+                for lower, name in lowercase_mapping.items()
+            },
+        )
+
+
 class Menu(BaseModel):
     """Complete menu containing all items organized by category.
 
@@ -133,6 +217,8 @@ class Menu(BaseModel):
         categories: Dictionary mapping category names to lists of items
     """
 
+    model_config = ConfigDict(frozen=True)
+
     categories: dict[str, list[Item]] = Field(default_factory=dict)
 
     def add_item(self, item: Item) -> None:
@@ -145,6 +231,40 @@ class Menu(BaseModel):
             self.categories[item.category_name] = []
         self.categories[item.category_name].append(item)
 
+        # Drop derived lookups so they are rebuilt with the new item
+        self.__dict__.pop("category_indexes", None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "Menu":
+        """Copy this menu, rebuilding category indexes on the copy.
+
+        The cached indexes reference the original's items, so they are
+        dropped rather than shared with a copy that may be mutated.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("category_indexes", None)
+        return copied
+
+    @cached_property
+    def category_indexes(self) -> dict[str, LowercaseIndex]:
+        """Lowercase name index for each category."""
+        return {
+            category_name: LowercaseIndex.from_items(items)
+            for category_name, items in self.categories.items()
+        }
+
+    def get_category_lowercase_index(self, category_name: str) -> LowercaseIndex | None:
+        """Get the lowercase name index for a category.
+
+        Args:
+            category_name: The name of the category
+
+        Returns:
+            The category's index, or None if the category doesn't exist
+        """
+        return self.category_indexes.get(category_name)
+
     def get_category(self, category_name: str) -> list[Item]:
         """Get all items in a specific category.
 
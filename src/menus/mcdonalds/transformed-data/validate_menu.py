@@ -9,10 +9,11 @@ from jsonschema import ValidationError, validate
 
 def validate_menu():
     """Validate the McDonald's menu JSON against its schema."""
-    base_dir = Path(__file__).parent / "transformed-data"
+    # The schema and data live alongside this script
+    base_dir = Path(__file__).parent
 
     # Load the schema
-    schema_path = base_dir / "menu-structure-schema.json"
+    schema_path = base_dir / "menu-structure-2026-01-21.schema.json"
     with open(schema_path) as f:
         schema = json.load(f)
 
@@ -6,10 +6,15 @@ All order mutations (add, remove, update) flow through OrderStateManager.
 
 import json
 import uuid
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+# Shared compact encoder for incremental log lines. json.dumps builds a new
+# JSONEncoder whenever it is given non-default options, so reuse one instead.
+_LOG_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 @dataclass
 class OrderItem:
@@ -62,6 +67,19 @@ class OrderStateManager:
     Thread-safety: NOT thread-safe. Each agent session gets its own instance.
     """
 
+    # One instance per session; slots keep them small and attribute access fast
+    __slots__ = (
+        "_final_order_path",
+        "_incremental_log_path",
+        "_item_ids_by_name",
+        "_items",
+        "_output_dir",
+        "_session_dir",
+        "_session_id",
+        "_start_time",
+        "_status",
+    )
+
     def __init__(self, session_id: str, output_dir: str = "orders") -> None:
         """Initialize order state for a session.
 
@@ -79,6 +97,8 @@ class OrderStateManager:
 
         # In-memory state
         self._items: list[OrderItem] = []
+        # Lowercase item name -> IDs of items with that name, oldest first
+        self._item_ids_by_name: defaultdict[str, deque[str]] = defaultdict(deque)
         self._start_time = datetime.now()
         self._status = "in_progress"  # or "completed", "cancelled"
 
@@ -123,13 +143,16 @@ class OrderStateManager:
 
         # Add to in-memory state
         self._items.append(item)
+        self._item_ids_by_name[item_name.lower()].append(item.item_id)
 
-        # Log event
+        # Log event, stamped with the item's own creation time so the clock
+        # is read and formatted once
+        item_dict = item.to_dict()
         self._append_to_log(
             {
                 "event": "add_item",
-                "timestamp": datetime.now().isoformat(),
-                "item": item.to_dict(),
+                "timestamp": item_dict["timestamp"],
+                "item": item_dict,
             }
         )
 
@@ -160,6 +183,14 @@ class OrderStateManager:
 
         # Remove from in-memory state
         self._items.remove(item_to_remove)
+        name_key = item_to_remove.item_name.lower()
+        item_ids = self._item_ids_by_name[name_key]
+        if item_ids[-1] == item_id:
+            item_ids.pop()
+        else:
+            item_ids.remove(item_id)
+        if not item_ids:
+            del self._item_ids_by_name[name_key]
 
         # Log event
         self._append_to_log(
@@ -229,15 +260,17 @@ class OrderStateManager:
             - Appends completion event to incremental log
         """
         self._status = "completed"
+        completion_time = datetime.now().isoformat()
+        total_items = self.get_total_count()
 
         # Build final order dict
         final_order = {
             "session_id": self._session_id,
             "start_time": self._start_time.isoformat(),
-            "completion_time": datetime.now().isoformat(),
+            "completion_time": completion_time,
             "status": self._status,
             "items": [item.to_dict() for item in self._items],
-            "total_items": self.get_total_count(),
+            "total_items": total_items,
             "order_summary": self.get_order_summary(),
         }
 
@@ -249,8 +282,8 @@ class OrderStateManager:
         self._append_to_log(
             {
                 "event": "complete_order",
-                "timestamp": datetime.now().isoformat(),
-                "total_items": self.get_total_count(),
+                "timestamp": completion_time,
+                "total_items": total_items,
             }
         )
 
@@ -264,6 +297,7 @@ class OrderStateManager:
             - Appends clear event to incremental log
         """
         self._items.clear()
+        self._item_ids_by_name.clear()
         self._status = "cancelled"
 
         # Log clear event
@@ -313,6 +347,18 @@ class OrderStateManager:
                 )
         return None
 
+    def get_latest_item_id(self, item_name: str) -> str | None:
+        """Get the ID of the most recently added item with a given name.
+
+        Args:
+            item_name: Name of the item (case-insensitive)
+
+        Returns:
+            The item's UUID if the order contains that item, None otherwise
+        """
+        item_ids = self._item_ids_by_name.get(item_name.lower())
+        return item_ids[-1] if item_ids else None
+
     def get_total_count(self) -> int:
         """Get total number of items (accounting for quantities).
 
@@ -359,8 +405,8 @@ class OrderStateManager:
         Args:
             event: Event dictionary to log
         """
-        with open(self._incremental_log_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        with open(self._incremental_log_path, "a", encoding="utf-8") as f:
+            f.write(_LOG_ENCODER.encode(event) + "\n")
 
     def _ensure_session_directory(self) -> None:
         """Create session directory if it doesn't exist."""
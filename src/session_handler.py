@@ -41,6 +41,11 @@ class SessionHandler:
         self.tts = tts
         self.agent = agent
         self.session_config = session_config
+        # Components are fixed for the handler's lifetime, so describe them once
+        self._component_names = (
+            f"STT: {type(stt).__name__}, LLM: {type(llm).__name__}, "
+            f"TTS: {type(tts).__name__}"
+        )
         logger.info("SessionHandler initialized")
 
     @logger.catch
@@ -57,9 +62,7 @@ class SessionHandler:
 
         logger.info(f"Starting session for room: {ctx.room.name}")
 
-        logger.debug(
-            f"Using STT: {type(self.stt).__name__}, LLM: {type(self.llm).__name__}, TTS: {type(self.tts).__name__}"
-        )
+        logger.debug(f"Using {self._component_names}")
 
         # Set up the voice AI pipeline with injected components
         turn_detection = (
@@ -79,13 +82,13 @@ class SessionHandler:
         )
 
         # Configure room options
-        room_options = room_io.RoomOptions()
         if self.session_config.enable_noise_cancellation:
-            room_options = room_io.RoomOptions(
-                audio_input=room_io.AudioInputOptions(
-                    noise_cancellation=noise_cancellation.BVC(),
-                ),
+            audio_input = room_io.AudioInputOptions(
+                noise_cancellation=noise_cancellation.BVC(),
             )
+        else:
+            audio_input = NOT_GIVEN
+        room_options = room_io.RoomOptions(audio_input=audio_input)
 
         # Start the session
         await session.start(
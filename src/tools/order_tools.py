@@ -10,13 +10,16 @@ Key Principles:
 - Return helpful string responses for the LLM to relay to users
 """
 
+from functools import lru_cache
+
 from livekit.agents import llm
 from livekit.agents.llm import function_tool
 from loguru import logger
 from rapidfuzz import fuzz, process
 
 from menu_provider import MenuProvider
-from menu_validation import validate_order_item
+from menu_validation import validate_modifiers
+from menus.mcdonalds.models import Item
 from order_state_manager import OrderStateManager
 
 
@@ -38,13 +41,11 @@ def _strip_category_suffix(item_name: str) -> str:
         >>> _strip_category_suffix("Big Mac")
         "Big Mac"
     """
-    if not item_name:
-        return item_name
-
-    # Check if item name has category in parentheses
-    if '(' in item_name and ')' in item_name:
-        # Split on '(' and take first part, strip whitespace
-        return item_name.split('(')[0].strip()
+    # Check if item name has category in parentheses; partition finds the
+    # first '(' and the text before it in one pass
+    head, paren, _ = item_name.partition("(")
+    if paren and ")" in item_name:
+        return head.strip()
 
     return item_name
 
@@ -73,6 +74,33 @@ def create_order_tools(
         >>> tools = create_order_tools(order_state, menu_provider)
         >>> agent = Agent(tools=tools, ...)
     """
+    # The menu is immutable, so build the lookups used by add_item_to_order once
+    # per session instead of on every tool call
+    all_items = tuple(
+        item
+        for category_name in menu_provider.get_all_categories()
+        for item in menu_provider.get_category(category_name)
+    )
+    exact_by_lower: dict[str, Item] = {}
+    for item in all_items:
+        exact_by_lower.setdefault(item.name_lower, item)
+    # Lowercase names parallel to all_items, for case-insensitive fuzzy search
+    lowercase_names = tuple(item.name_lower for item in all_items)
+
+    @lru_cache(maxsize=128)
+    def fuzzy_match_menu_item(name_lower: str) -> tuple[Item, float] | None:
+        """Fuzzy match a lowercase item name, memoized for repeat requests."""
+        fuzzy_result = process.extractOne(
+            name_lower,
+            lowercase_names,
+            scorer=fuzz.ratio,
+            score_cutoff=80,  # Slightly lower threshold for better matches (was 85)
+        )
+        if fuzzy_result is None:
+            return None
+        # The returned index points straight at the matching item
+        _, score, index = fuzzy_result
+        return all_items[index], score
 
     @function_tool(
         name="add_item_to_order",
@@ -131,17 +159,8 @@ def create_order_tools(
         modifiers = modifiers or []
         logger.debug(f"Looking up item: {item_name}")
 
-        # Get all items from the menu
-        all_items = []
-        for category_name in menu_provider.get_all_categories():
-            all_items.extend(menu_provider.get_category(category_name))
-
         # Try exact match first (case-insensitive)
-        exact_match = None
-        for item in all_items:
-            if item.item_name.lower() == item_name.lower():
-                exact_match = item
-                break
+        exact_match = exact_by_lower.get(item_name.lower())
 
         if exact_match:
             matched_item = exact_match
@@ -151,26 +170,10 @@ def create_order_tools(
             )
         else:
             # Use fuzzy matching with rapidfuzz (case-insensitive)
-            item_names = [item.item_name for item in all_items]
-            # Create lowercase mapping for case-insensitive search
-            lowercase_mapping = {name.lower(): name for name in item_names}
-            lowercase_names = list(lowercase_mapping.keys())
-
-            fuzzy_result = process.extractOne(
-                item_name.lower(),  # Convert query to lowercase
-                lowercase_names,
-                scorer=fuzz.ratio,
-                score_cutoff=80,  # Slightly lower threshold for better matches (was 85)
-            )
+            fuzzy_result = fuzzy_match_menu_item(item_name.lower())
 
             if fuzzy_result:
-                matched_lowercase, score, _ = fuzzy_result
-                # Map back to original case
-                original_name = lowercase_mapping[matched_lowercase]
-                # Find the item with this name
-                matched_item = next(
-                    item for item in all_items if item.item_name == original_name
-                )
+                matched_item, score = fuzzy_result
                 category = matched_item.category_name
                 logger.debug(
                     f"Found fuzzy match: {matched_item.item_name} (score: {score}) in category {category}"
@@ -180,22 +183,17 @@ def create_order_tools(
                 logger.warning(f"Item '{item_name}' not found in menu")
                 return f"Sorry, I couldn't find '{item_name}' on our menu. Could you try a different item?"
 
-        # Now validate with the found category
+        # The item was resolved against the menu above, so only the modifiers
+        # still need validating
         # Use threshold of 70 for better fuzzy matching on common modifiers (typos like "pickels")
-        validation_result = validate_order_item(
-            item_name=matched_item.item_name,
-            category=category,
-            modifiers=modifiers,
-            menu=menu_provider.get_menu(),
-            fuzzy_threshold=70,
-        )
+        validation_result = validate_modifiers(matched_item, modifiers, fuzzy_threshold=70)
 
         # If invalid, return error message without mutating state
         if not validation_result.is_valid:
             logger.warning(f"Validation failed: {validation_result.error_message}")
             return f"Sorry, I couldn't add that item: {validation_result.error_message}"
 
-        # Use matched item from validation (might be fuzzy matched to correct spelling)
+        # Use matched item from the lookup (might be fuzzy matched to correct spelling)
         validated_item = validation_result.matched_item
         logger.debug(f"Validation successful, matched item: {validated_item.item_name}")
 
@@ -206,17 +204,13 @@ def create_order_tools(
             quantity=quantity,
         )
 
-        # Build confirmation message
-        modifier_text = ""
-        if modifiers:
-            modifier_text = f" with {', '.join(modifiers)}"
-
-        if quantity > 1:
-            response = f"Added {quantity} {validated_item.item_name}{modifier_text} to your order."
+        # Build confirmation message; a single plain item is the common case
+        if not modifiers and quantity <= 1:
+            response = f"Added one {validated_item.item_name} to your order."
         else:
-            response = (
-                f"Added one {validated_item.item_name}{modifier_text} to your order."
-            )
+            modifier_text = f" with {', '.join(modifiers)}" if modifiers else ""
+            count_text = str(quantity) if quantity > 1 else "one"
+            response = f"Added {count_text} {validated_item.item_name}{modifier_text} to your order."
 
         logger.info(f"Successfully added item: {response}")
         return response
@@ -285,21 +279,14 @@ def create_order_tools(
         item_name = _strip_category_suffix(item_name)
 
         # Find item by name (use latest item with that name)
-        items = order_state.get_items()
-        item_to_remove = None
-
-        # Search from end (most recent items first)
-        for item in reversed(items):
-            if item.item_name.lower() == item_name.lower():
-                item_to_remove = item
-                break
+        item_id = order_state.get_latest_item_id(item_name)
 
-        if item_to_remove is None:
+        if item_id is None:
             logger.debug(f"Item '{item_name}' not found in order")
             return f"I don't see '{item_name}' in your order."
 
         # Remove item
-        success = order_state.remove_item(item_to_remove.item_id)
+        success = order_state.remove_item(item_id)
 
         if success:
             logger.info(f"Removed {item_name} from order")
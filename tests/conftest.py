@@ -152,9 +152,13 @@ def test_menu_provider(tmp_path, test_menu_data) -> MenuProvider:
     return MenuProvider(str(menu_file))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def real_menu_provider() -> MenuProvider:
-    """Create MenuProvider with real menu file."""
+    """Create MenuProvider with real menu file.
+
+    Session-scoped: the provider is read-only, so every test can share one
+    parse of the menu.
+    """
     menu_path = "src/menus/mcdonalds/transformed-data/menu-structure-2026-01-21.json"
     return MenuProvider(menu_path)
 
@@ -201,9 +205,9 @@ def order_manager(temp_output_dir):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def menu_provider() -> MenuProvider:
-    """Create MenuProvider with real menu for order tools tests."""
+    """Create MenuProvider with real menu for order tools tests (shared, read-only)."""
     menu_path = "src/menus/mcdonalds/transformed-data/menu-structure-2026-01-21.json"
     return MenuProvider(menu_path)
 
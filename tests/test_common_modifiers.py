@@ -4,6 +4,7 @@ import pytest
 
 from common_modifiers import (
     COMMON_MODIFIERS,
+    are_common_modifiers_for_category,
     get_common_modifiers_for_category,
     is_common_modifier_for_category,
 )
@@ -85,6 +86,37 @@ class TestIsCommonModifierForCategory:
         assert is_valid == expected
 
 
+class TestAreCommonModifiersForCategory:
+    """Tests for are_common_modifiers_for_category function."""
+
+    def test_matches_single_modifier_results(self):
+        """Test batch results agree with the single-modifier function."""
+        modifiers = ["extra cheese", "no pickels", "anchovies", "NO ONIONS"]
+        expected = [
+            is_common_modifier_for_category(m, "Beef & Pork", threshold=70)
+            for m in modifiers
+        ]
+
+        results = are_common_modifiers_for_category(
+            modifiers, "Beef & Pork", threshold=70
+        )
+
+        assert results == expected
+        assert results[1] == (True, "No Pickles")
+        assert results[2] == (False, None)
+
+    def test_empty_modifiers(self):
+        """Test empty modifier list returns empty results."""
+        assert are_common_modifiers_for_category([], "Beef & Pork") == []
+
+    def test_invalid_category(self):
+        """Test invalid category marks every modifier invalid."""
+        results = are_common_modifiers_for_category(
+            ["Extra Cheese", "No Ice"], "Unknown Category"
+        )
+        assert results == [(False, None), (False, None)]
+
+
 class TestGetCommonModifiersForCategory:
     """Tests for get_common_modifiers_for_category function."""
 
@@ -14,9 +14,9 @@ from menu_provider import MenuProvider
 from order_state_manager import OrderStateManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def menu_provider():
-    """Real menu provider."""
+    """Real menu provider (shared, read-only)."""
     return MenuProvider(
         "src/menus/mcdonalds/transformed-data/menu-structure-2026-01-21.json"
     )
@@ -61,6 +61,14 @@ def test_agent_creates_tools(drive_thru_agent):
     assert agent is not None
 
 
+def test_agent_get_tool_by_name(drive_thru_agent):
+    """Test that tools can be fetched by name."""
+    add_item_tool = drive_thru_agent.get_tool("add_item_to_order")
+
+    assert add_item_tool is drive_thru_agent.tools[0]
+    assert drive_thru_agent.get_tool("nonexistent_tool") is None
+
+
 def test_agent_has_instructions(drive_thru_agent):
     """Test that agent has instructions set."""
     agent = drive_thru_agent.agent
@@ -51,11 +51,7 @@ async def test_add_item_tool_integration(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get the add_item tool
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__") and tool.__name__ == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     assert add_item_tool is not None, "add_item_to_order tool not found"
 
@@ -78,11 +74,7 @@ async def test_add_item_with_fuzzy_matching(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get the add_item tool
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__") and tool.__name__ == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     # Try to add "big mak" (misspelled)
     result = await add_item_tool(
@@ -106,11 +98,7 @@ async def test_add_invalid_item(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get the add_item tool
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__") and tool.__name__ == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     # Try to add an invalid item
     result = await add_item_tool(
@@ -132,11 +120,7 @@ async def test_add_multiple_items(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get the add_item tool
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__") and tool.__name__ == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     # Add Big Mac
     await add_item_tool(item_name="Big Mac", modifiers=[], quantity=1)
@@ -170,14 +154,8 @@ async def test_complete_order_integration(agent_with_real_components, tmp_path):
     agent = agent_with_real_components
 
     # Get tools
-    add_item_tool = None
-    complete_order_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__"):
-            if tool.__name__ == "add_item_to_order":
-                add_item_tool = tool
-            elif tool.__name__ == "complete_order":
-                complete_order_tool = tool
+    add_item_tool = agent.get_tool("add_item_to_order")
+    complete_order_tool = agent.get_tool("complete_order")
 
     # Add items
     await add_item_tool(item_name="Big Mac", modifiers=[], quantity=2)
@@ -214,14 +192,8 @@ async def test_remove_item_integration(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get tools
-    add_item_tool = None
-    remove_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__"):
-            if tool.__name__ == "add_item_to_order":
-                add_item_tool = tool
-            elif tool.__name__ == "remove_item_from_order":
-                remove_item_tool = tool
+    add_item_tool = agent.get_tool("add_item_to_order")
+    remove_item_tool = agent.get_tool("remove_item_from_order")
 
     # Add items
     await add_item_tool(item_name="Big Mac", modifiers=[], quantity=1)
@@ -252,11 +224,7 @@ async def test_complete_empty_order(agent_with_real_components):
     agent = agent_with_real_components
 
     # Get complete_order tool
-    complete_order_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "__name__") and tool.__name__ == "complete_order":
-            complete_order_tool = tool
-            break
+    complete_order_tool = agent.get_tool("complete_order")
 
     # Try to complete empty order
     result = await complete_order_tool()
@@ -309,11 +277,7 @@ async def test_modifier_decline_no_duplicate_tool_calls(agent_with_real_componen
     agent = agent_with_real_components
 
     # Verify the add_item_to_order tool exists
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "info") and tool.info.name == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     assert add_item_tool is not None, "add_item_to_order tool not found"
 
@@ -355,11 +319,7 @@ async def test_tool_description_emphasizes_single_call(agent_with_real_component
     agent = agent_with_real_components
 
     # Find the add_item_to_order tool
-    add_item_tool = None
-    for tool in agent.tools:
-        if hasattr(tool, "info") and tool.info.name == "add_item_to_order":
-            add_item_tool = tool
-            break
+    add_item_tool = agent.get_tool("add_item_to_order")
 
     assert add_item_tool is not None
 
@@ -152,6 +152,19 @@ def test_find_relevant_items_respects_max_limit(drive_thru_llm_real_menu):
     assert len(items) <= drive_thru_llm_real_menu._max_context_items
 
 
+def test_find_relevant_items_caches_repeated_keywords(drive_thru_llm):
+    """Test that repeated keyword sequences reuse the cached menu search."""
+    search_items = Mock(wraps=drive_thru_llm._menu_provider.search_items)
+    drive_thru_llm._menu_provider.search_items = search_items
+
+    first = drive_thru_llm._find_relevant_items(["big", "mac"])
+    second = drive_thru_llm._find_relevant_items(["big", "mac", "big"])
+
+    assert [item.item_name for item in first] == ["Big Mac"]
+    assert [item.item_name for item in second] == ["Big Mac"]
+    assert search_items.call_count == 2  # One search per distinct keyword
+
+
 # ============================================================================
 # Context Injection Tests
 # ============================================================================
@@ -201,6 +214,54 @@ async def test_chat_injects_menu_context(drive_thru_llm_real_menu, mock_wrapped_
     assert "Big Mac" in content_text or "menu" in content_text.lower()
 
 
+@pytest.mark.asyncio
+async def test_chat_reuses_original_messages(
+    drive_thru_llm_real_menu, mock_wrapped_llm
+):
+    """Test that injection inserts the menu message without rebuilding the rest."""
+    chat_ctx = ChatContext()
+    system_msg = chat_ctx.add_message(
+        role="system", content="You are a drive-thru agent"
+    )
+    user_msg = chat_ctx.add_message(role="user", content="I want a Big Mac")
+
+    await drive_thru_llm_real_menu.chat(chat_ctx=chat_ctx)
+
+    augmented_ctx = mock_wrapped_llm.chat.call_args.kwargs["chat_ctx"]
+    assert len(augmented_ctx.items) == 3
+    assert augmented_ctx.items[0] is system_msg
+    assert augmented_ctx.items[2] is user_msg
+    assert augmented_ctx.items[1].role == "system"
+    # Original context is left untouched
+    assert chat_ctx.items == [system_msg, user_msg]
+
+
+@pytest.mark.asyncio
+async def test_chat_replaces_previous_menu_context(
+    drive_thru_llm_real_menu, mock_wrapped_llm
+):
+    """Test that re-injecting into an augmented context keeps one menu message."""
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="system", content="You are a drive-thru agent")
+    chat_ctx.add_message(role="user", content="I want a Big Mac")
+
+    await drive_thru_llm_real_menu.chat(chat_ctx=chat_ctx)
+    first_ctx = mock_wrapped_llm.chat.call_args.kwargs["chat_ctx"]
+    first_ctx.add_message(role="user", content="And a McChicken")
+
+    await drive_thru_llm_real_menu.chat(chat_ctx=first_ctx)
+    second_ctx = mock_wrapped_llm.chat.call_args.kwargs["chat_ctx"]
+
+    menu_messages = [
+        item
+        for item in second_ctx.items
+        if item.role == "system" and "Relevant menu items" in item.text_content
+    ]
+    assert len(menu_messages) == 1
+    assert "McChicken" in menu_messages[0].text_content
+    assert len(second_ctx.items) == 4
+
+
 @pytest.mark.asyncio
 async def test_chat_delegates_to_wrapped_llm(drive_thru_llm, mock_wrapped_llm):
     """Test that chat properly delegates to wrapped LLM."""
@@ -345,6 +406,44 @@ def test_format_items_for_context(drive_thru_llm_real_menu):
     assert len(formatted) > 0
 
 
+def test_format_items_for_context_reuses_item_lines(drive_thru_llm_real_menu):
+    """Test that each item's line is formatted once and reused on later turns."""
+    items = drive_thru_llm_real_menu._menu_provider.search_items("Big Mac")
+
+    first = drive_thru_llm_real_menu._format_items_for_context(items)
+    second = drive_thru_llm_real_menu._format_items_for_context(items)
+
+    assert first == second
+    assert len(drive_thru_llm_real_menu._context_lines) == len(items)
+
+
+def test_format_items_for_context_reuses_rendered_text(drive_thru_llm_real_menu):
+    """Test that the same items on a later turn reuse the rendered text."""
+    items = drive_thru_llm_real_menu._menu_provider.search_items("McFlurry")
+
+    first = drive_thru_llm_real_menu._format_items_for_context(items)
+    second = drive_thru_llm_real_menu._format_items_for_context(list(items))
+
+    assert second is first
+
+
+def test_format_items_for_context_cache_is_bounded(drive_thru_llm):
+    """Test that rendered texts for distinct item lists are evicted, oldest first."""
+    from drive_thru_llm import _MAX_CONTEXT_TEXTS
+    from menus.mcdonalds.models import Item
+
+    items = [
+        Item(category_name="Snacks", item_name=f"Item {n}", available_as_base=True)
+        for n in range(_MAX_CONTEXT_TEXTS + 10)
+    ]
+    for item in items:
+        drive_thru_llm._format_items_for_context([item])
+
+    assert len(drive_thru_llm._context_texts) == _MAX_CONTEXT_TEXTS
+    assert ("Item 0",) not in drive_thru_llm._context_texts
+    assert (items[-1].item_name,) in drive_thru_llm._context_texts
+
+
 def test_format_items_for_context_empty_list(drive_thru_llm):
     """Test formatting empty list of items."""
     formatted = drive_thru_llm._format_items_for_context([])
@@ -376,6 +475,15 @@ def test_get_latest_user_message_no_user_messages(drive_thru_llm):
     assert latest is None or latest == ""
 
 
+def test_get_latest_user_message_joins_text_parts(drive_thru_llm):
+    """Test that a multi-part user message is joined with spaces."""
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="user", content=["Big Mac", "and fries"])
+
+    latest = drive_thru_llm._get_latest_user_message(chat_ctx)
+    assert latest == "Big Mac and fries"
+
+
 # ============================================================================
 # FunctionCall Handling Tests
 # ============================================================================
@@ -118,6 +118,45 @@ class TestItem:
         assert modifier.modifier_name == "Cheese"
         assert modifier in item.modifiers
 
+    def test_item_derived_lookups(self):
+        """Test lowercase name and modifier lookups, including after add_modifier."""
+        item = Item(
+            category_name="Beef & Pork",
+            item_name="Quarter Pounder",
+            available_as_base=True,
+        )
+        item.add_modifier("Cheese")
+
+        assert item.name_lower == "quarter pounder"
+        assert item.modifier_names == ("Cheese",)
+        assert item.modifier_lookup == {"cheese": "Cheese"}
+
+        item.add_modifier("Bacon")
+        assert item.modifier_names == ("Cheese", "Bacon")
+        assert item.modifier_lookup == {"cheese": "Cheese", "bacon": "Bacon"}
+
+        # Derived lookups are not serialized
+        assert "name_lower" not in item.model_dump()
+
+    def test_item_model_copy_recomputes_derived_lookups(self):
+        """Test model_copy(update=...) does not carry over stale lookups."""
+        item = Item(
+            category_name="Beef & Pork",
+            item_name="Quarter Pounder",
+            available_as_base=True,
+        )
+        item.add_modifier("Cheese")
+        assert item.name_lower == "quarter pounder"
+        assert item.modifier_lookup == {"cheese": "Cheese"}
+
+        renamed = item.model_copy(update={"item_name": "Double Quarter Pounder"})
+        assert renamed.name_lower == "double quarter pounder"
+        assert item.name_lower == "quarter pounder"
+
+        plain = item.model_copy(update={"modifiers": []})
+        assert plain.modifier_names == ()
+        assert plain.modifier_lookup == {}
+
     def test_item_json_serialization(self):
         """Test serializing an item to JSON."""
         item = Item(
@@ -334,6 +373,32 @@ class TestMenu:
         assert "Breakfast" in menu.categories
         assert len(menu.get_category("Breakfast")) == 2
 
+    def test_menu_category_lowercase_index(self):
+        """Test the per-category lowercase index is rebuilt after add_item."""
+        menu = Menu()
+        menu.add_item(
+            Item(
+                category_name="Breakfast",
+                item_name="Egg McMuffin",
+                available_as_base=True,
+            )
+        )
+
+        index = menu.get_category_lowercase_index("Breakfast")
+        assert index is not None
+        assert index.names_lower == ("egg mcmuffin",)
+        assert menu.get_category_lowercase_index("Breakfast") is index
+        assert menu.get_category_lowercase_index("Lunch") is None
+
+        hash_brown = Item(
+            category_name="Breakfast", item_name="Hash Brown", available_as_base=True
+        )
+        menu.add_item(hash_brown)
+
+        index = menu.get_category_lowercase_index("Breakfast")
+        assert index.names_lower == ("egg mcmuffin", "hash brown")
+        assert index.name_to_item["hash brown"] is hash_brown
+
     def test_menu_multiple_categories(self):
         """Test menu with multiple categories."""
         menu = Menu()
@@ -1,6 +1,7 @@
 """Tests for MenuProvider - Read-only menu data access layer."""
 
 import pytest
+from pydantic import ValidationError
 
 from menu_provider import MenuProvider
 
@@ -94,6 +95,28 @@ def test_search_items_empty_keyword(test_menu_provider):
     assert isinstance(results, list)
 
 
+def test_search_items_does_not_match_across_item_names(test_menu_provider):
+    """A keyword spanning the end of one name and the start of the next is no match."""
+    results = test_menu_provider.search_items("mcmuffin\nhash")
+    assert results == []
+
+
+def test_search_items_returns_each_item_once(test_menu_provider):
+    """An item whose name contains the keyword twice is returned once."""
+    results = test_menu_provider.search_items("c")
+    item_names = [item.item_name for item in results]
+    assert item_names.count("McChicken") == 1
+
+
+def test_search_items_repeated_keyword_is_cached(test_menu_provider):
+    """Repeating a search returns the same items without rescanning."""
+    first = test_menu_provider.search_items("Mac")
+    second = test_menu_provider.search_items("mac")
+
+    assert [item.item_name for item in first] == [item.item_name for item in second]
+    assert test_menu_provider._scan_item_names.cache_info().hits == 1
+
+
 # ============================================================================
 # Category Tests
 # ============================================================================
@@ -172,48 +195,45 @@ def test_get_item_case_insensitive(test_menu_provider):
 # ============================================================================
 
 
-def test_returns_copies_not_references(test_menu_provider):
-    """Verify MenuProvider returns copies, not mutable references."""
-    # Get the same item twice
+def test_returned_items_are_immutable(test_menu_provider):
+    """Verify MenuProvider returns items that cannot be mutated."""
     item1 = test_menu_provider.get_item("Beef & Pork", "Big Mac")
-    item2 = test_menu_provider.get_item("Beef & Pork", "Big Mac")
 
-    # Modify item1
+    # Attempting to modify item1 fails
     assert item1 is not None
-    item1.quantity = 999
+    with pytest.raises(ValidationError):
+        item1.quantity = 999
 
-    # item2 should be unaffected
+    # Re-fetch is unaffected
+    item2 = test_menu_provider.get_item("Beef & Pork", "Big Mac")
     assert item2 is not None
     assert item2.quantity == 1  # Default
 
-    # Re-fetch should also be unaffected
-    item3 = test_menu_provider.get_item("Beef & Pork", "Big Mac")
-    assert item3 is not None
-    assert item3.quantity == 1
 
-
-def test_search_returns_copies(test_menu_provider):
-    """search_items() returns copies, not references."""
+def test_search_returns_immutable_items(test_menu_provider):
+    """search_items() returns items that cannot be mutated."""
     results1 = test_menu_provider.search_items("Big Mac")
-    results2 = test_menu_provider.search_items("Big Mac")
 
-    # Modify first result
-    results1[0].quantity = 42
+    with pytest.raises(ValidationError):
+        results1[0].quantity = 42
 
-    # Second result should be unaffected
+    # Clearing the returned list doesn't affect later searches
+    results1.clear()
+    results2 = test_menu_provider.search_items("Big Mac")
     assert results2[0].quantity == 1
 
 
-def test_get_category_returns_copies(test_menu_provider):
-    """get_category() returns copies, not references."""
+def test_get_category_returns_immutable_items(test_menu_provider):
+    """get_category() returns a new list of items that cannot be mutated."""
     items1 = test_menu_provider.get_category("Breakfast")
-    items2 = test_menu_provider.get_category("Breakfast")
 
-    # Modify first result
-    items1[0].quantity = 100
+    with pytest.raises(ValidationError):
+        items1[0].quantity = 100
 
-    # Second result should be unaffected
-    assert items2[0].quantity == 1
+    # Modifying the returned list doesn't affect the category
+    items1.clear()
+    items2 = test_menu_provider.get_category("Breakfast")
+    assert len(items2) > 0
 
 
 # ============================================================================
@@ -242,16 +262,28 @@ def test_category_exists(test_menu_provider):
     assert test_menu_provider.category_exists("InvalidCategory") is False
 
 
-def test_get_menu_returns_copy(test_menu_provider):
-    """get_menu() returns a deep copy."""
-    menu1 = test_menu_provider.get_menu()
-    menu2 = test_menu_provider.get_menu()
+def test_get_menu_returns_immutable_menu(test_menu_provider):
+    """get_menu() returns a menu whose items cannot be mutated."""
+    menu = test_menu_provider.get_menu()
 
-    # Modify menu1
-    menu1.categories["Breakfast"][0].quantity = 999
+    with pytest.raises(ValidationError):
+        menu.categories["Breakfast"][0].quantity = 999
 
-    # menu2 should be unaffected
-    assert menu2.categories["Breakfast"][0].quantity == 1
+    assert test_menu_provider.get_menu().categories["Breakfast"][0].quantity == 1
+
+
+def test_get_menu_mutation_does_not_leak(test_menu_provider):
+    """Mutating a returned menu's containers leaves the provider's menu intact."""
+    menu = test_menu_provider.get_menu()
+    breakfast_count = len(menu.get_category("Breakfast"))
+
+    menu.categories["Breakfast"].clear()
+    menu.categories.pop("Beef & Pork")
+
+    fresh = test_menu_provider.get_menu()
+    assert len(fresh.get_category("Breakfast")) == breakfast_count
+    assert fresh.get_category_lowercase_index("Breakfast") is not None
+    assert test_menu_provider.category_exists("Beef & Pork") is True
 
 
 # ============================================================================
@@ -15,6 +15,7 @@ from menu_validation import (
     validate_modifiers,
     validate_order_item,
 )
+from menus.mcdonalds.models import Item, LowercaseIndex
 
 # Fuzzy Matching Tests
 
@@ -92,6 +93,14 @@ class TestFuzzyMatchItem:
         assert result.is_valid is False
         assert "empty" in result.error_message.lower()
 
+    def test_fuzzy_match_uses_precomputed_index(self, sample_menu_items):
+        """Test a precomputed index gives the same match as building one."""
+        index = LowercaseIndex.from_items(sample_menu_items)
+        result = fuzzy_match_item("Big Mack", sample_menu_items, precomputed=index)
+
+        assert result.is_valid is True
+        assert result.matched_item is index.name_to_item["big mac"]
+
 
 # Item Validation Tests
 
@@ -201,6 +210,19 @@ class TestValidateModifiers:
         assert "Invalid modifiers" in result.error_message
         assert "Anchovies" in result.error_message
 
+    def test_validate_modifiers_rejects_other_category_modifier(self):
+        """Test 'Extra Cheese' isn't fuzzy matched to a Beverages modifier."""
+        milk = Item(
+            category_name="Beverages",
+            item_name="1% Low Fat Milk Jug",
+            available_as_base=True,
+        )
+
+        result = validate_modifiers(milk, ["Extra Cheese"], fuzzy_threshold=70)
+
+        assert result.is_valid is False
+        assert "Extra Cheese" in result.error_message
+
     def test_validate_modifiers_multiple_invalid(self, big_mac_with_modifiers):
         """Test multiple invalid modifiers."""
         result = validate_modifiers(
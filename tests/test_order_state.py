@@ -309,6 +309,20 @@ def test_get_item_by_id_found(order_manager):
     assert found_item.item_id == item.item_id
 
 
+def test_get_latest_item_id_tracks_adds_and_removes(order_manager):
+    """Test latest item ID lookup by name stays in sync with the order."""
+    first = order_manager.add_item("Big Mac", "Beef & Pork")
+    second = order_manager.add_item("Big Mac", "Beef & Pork")
+
+    assert order_manager.get_latest_item_id("big mac") == second.item_id
+
+    order_manager.remove_item(second.item_id)
+    assert order_manager.get_latest_item_id("Big Mac") == first.item_id
+
+    order_manager.clear_order()
+    assert order_manager.get_latest_item_id("Big Mac") is None
+
+
 def test_get_item_by_id_not_found(order_manager):
     """Test get_item_by_id when item doesn't exist."""
     result = order_manager.get_item_by_id("non-existent-id")
@@ -89,6 +89,19 @@ async def test_add_item_fuzzy_match_success(order_tools, order_state_manager):
     assert items[0].item_name == "Big Mac"  # Not "Big Mack"
 
 
+@pytest.mark.asyncio
+async def test_add_item_repeated_fuzzy_match(order_tools, order_state_manager):
+    """Repeating a misspelled item resolves to the same menu item each time."""
+    add_item_tool = order_tools[0]
+
+    await add_item_tool(item_name="Big Mack", quantity=1)
+    result = await add_item_tool(item_name="big mack", quantity=1)
+
+    assert "Added one Big Mac" in result
+    items = order_state_manager.get_items()
+    assert [item.item_name for item in items] == ["Big Mac", "Big Mac"]
+
+
 @pytest.mark.asyncio
 async def test_add_item_invalid_item(order_tools, order_state_manager):
     """Adding an item not on the menu fails with error message."""